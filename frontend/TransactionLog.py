@@ -16,6 +16,95 @@ Total: 40 characters per line (including padding)
 
 """
 
+import os
+from functools import lru_cache
+
+# Fixed record segments. For most transaction codes only the account
+# number and amount vary, so the code, blank name and trailing fields are
+# built (and encoded) once here instead of on every log call.
+_BLANK_NAME = b" " * 20
+_RECORD_PAD = b" " * 3            # 37 data characters padded to 40
+_ZERO_AMOUNT = b"00000.00"
+
+_WITHDRAWAL_PREFIX = b"01" + _BLANK_NAME
+_TRANSFER_PREFIX = b"02" + _BLANK_NAME
+_PAYBILL_PREFIX = b"03" + _BLANK_NAME
+_DEPOSIT_PREFIX = b"04" + _BLANK_NAME
+_DELETE_PREFIX = b"06" + _BLANK_NAME
+_DISABLE_PREFIX = b"07" + _BLANK_NAME
+_CHANGE_PLAN_PREFIX = b"08" + _BLANK_NAME
+
+_BLANK_SUFFIX = b"  " + _RECORD_PAD
+_CHANGE_PLAN_SUFFIX = b"NP" + _RECORD_PAD
+
+# Delete, disable and changeplan always log a zero amount, so everything
+# after the account number (amount, misc, padding) is constant.
+_ZERO_TAIL = _ZERO_AMOUNT + _BLANK_SUFFIX
+_ZERO_CHANGE_PLAN_TAIL = _ZERO_AMOUNT + _CHANGE_PLAN_SUFFIX
+
+# O_BINARY only exists (and matters) on Windows, where it stops newline
+# translation so the file matches the fixed-width layout byte for byte.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Deletes every non-digit ASCII character in one C-level pass.
+_NON_DIGITS = str.maketrans("", "", "".join(
+    ch for ch in map(chr, range(128)) if not ch.isdigit()
+))
+
+
+# The formatters below are module-level functions rather than methods so
+# the log_* methods reach them without an attribute lookup on self.
+
+@lru_cache(maxsize=2048)
+def _format_account(account_number):
+    """
+    Format account number as 5-digit zero-filled field.
+
+    A session keeps touching the same few accounts, so results are cached
+    per raw value and repeated log calls skip the digit filtering.
+
+    Args:
+        account_number (str/int): Raw account number
+
+    Returns:
+        bytes: 5-digit zero-filled account number
+
+    """
+    if isinstance(account_number, str):
+        if account_number.isdigit():
+            digits = account_number
+        else:
+            digits = account_number.translate(_NON_DIGITS)
+            if not digits.isascii():
+                digits = "".join(filter(str.isdigit, digits))
+        num = int(digits) if digits else 0
+    else:
+        num = int(account_number)
+
+    return b"%05d" % num
+
+
+def _format_amount(amount):
+    """
+    Format amount as 8-character field with two decimal places.
+
+    Example:
+        110 → b"00110.00"
+
+    Args:
+        amount (float/int): Dollar amount
+
+    Returns:
+        bytes: 8-character formatted amount
+
+    """
+    # Convert once to whole cents so the dollar/cent split is exact
+    # integer arithmetic and never needs a carry correction. bytes
+    # %-formatting runs in C and yields the field without an encode step.
+    dollars, cents = divmod(round(float(amount) * 100), 100)
+
+    return b"%05d.%02d" % (dollars, cents)
+
 
 class TransactionLog:
     """
@@ -30,15 +119,44 @@ class TransactionLog:
     """
 
     RECORD_LEN = 40  
+    _END_MARKER = b"00" + b" " * 38 + b"\n"   # end-of-session record
     def __init__(self):
         """
         Initialize a new TransactionLog.
 
-        Creates an empty list to store formatted transaction records
-        during the current session.
+        Creates an empty buffer to store formatted transaction records
+        during the current session. Records are appended already encoded
+        and newline-terminated, so writing the file needs no join or
+        text encoding step.
+
+        """
+        self.transactions = bytearray()
+        self._count = 0
+
+    def _append(self, record):
+        """
+        Append one formatted record to the session buffer.
+
+        Args:
+            record (bytes): 40-character transaction record
 
         """
-        self.transactions = []
+        if len(record) != self.RECORD_LEN:
+            # An out-of-range amount or account number breaks the fixed
+            # width, so the record is fitted to RECORD_LEN characters.
+            # Pure ASCII is fitted in place; a non-ASCII holder name makes
+            # the byte length differ from the character length, so such a
+            # record is measured and fitted as text.
+            if record.isascii():
+                record = record.ljust(self.RECORD_LEN)[:self.RECORD_LEN]
+            else:
+                text = record.decode()
+                if len(text) != self.RECORD_LEN:
+                    record = text.ljust(self.RECORD_LEN)[:self.RECORD_LEN].encode()
+
+        self.transactions += record
+        self.transactions += b"\n"
+        self._count += 1
 
     def _build_record(self, code, name, account_number, amount, misc):
         """
@@ -52,18 +170,18 @@ class TransactionLog:
             misc (str): 2-character miscellaneous field
 
         Returns:
-            str: 40-character formatted transaction record
+            bytes: 40-character formatted transaction record
 
         """
         code = (code or "").ljust(2)[:2]
         name = (name or "").ljust(20)[:20]
-        acc = self._format_account(account_number)   
-        amt = self._format_amount(amount)            
+        acc = _format_account(account_number)   
+        amt = _format_amount(amount)            
         misc = (misc or "").ljust(2)[:2]             
 
-        record = f"{code}{name}{acc}{amt}{misc}"
-
-        return record.ljust(self.RECORD_LEN)[:self.RECORD_LEN]
+        # Every field above is already exactly its fixed width (37 chars in
+        # total), so the record only needs the constant 3-space tail.
+        return (code + name).encode() + acc + amt + misc.encode() + _RECORD_PAD
 
     def log_withdrawal(self, account_number, amount):
         """
@@ -74,8 +192,8 @@ class TransactionLog:
             amount (float): Amount withdrawn
 
         """
-        record = self._build_record("01", "", account_number, amount, "")
-        self.transactions.append(record)
+        record = _WITHDRAWAL_PREFIX + _format_account(account_number) + _format_amount(amount) + _BLANK_SUFFIX
+        self._append(record)
 
     def log_transfer(self, account_number, amount):
         """
@@ -88,8 +206,8 @@ class TransactionLog:
             amount (float): Amount transferred
 
         """
-        record = self._build_record("02", "", account_number, amount, "")
-        self.transactions.append(record)
+        record = _TRANSFER_PREFIX + _format_account(account_number) + _format_amount(amount) + _BLANK_SUFFIX
+        self._append(record)
 
     def log_paybill(self, account_number, amount, company_code):
         """
@@ -101,8 +219,9 @@ class TransactionLog:
             company_code (str): Company code (EC, CQ, FI)
 
         """
-        record = self._build_record("03", "", account_number, amount, company_code)
-        self.transactions.append(record)
+        company = (company_code or "").ljust(2)[:2].encode()
+        record = _PAYBILL_PREFIX + _format_account(account_number) + _format_amount(amount) + company + _RECORD_PAD
+        self._append(record)
 
     def log_deposit(self, account_number, amount):
         """
@@ -113,8 +232,8 @@ class TransactionLog:
             amount (float): Amount deposited
 
         """
-        record = self._build_record("04", "", account_number, amount, "")
-        self.transactions.append(record)
+        record = _DEPOSIT_PREFIX + _format_account(account_number) + _format_amount(amount) + _BLANK_SUFFIX
+        self._append(record)
 
     def log_create(self, account_number, amount, name=""):
         """
@@ -126,7 +245,7 @@ class TransactionLog:
 
         """
         record = self._build_record("05", name, account_number, amount, "SP")
-        self.transactions.append(record)
+        self._append(record)
 
     def log_delete(self, account_number):
         """
@@ -136,8 +255,8 @@ class TransactionLog:
             account_number (str): Account being deleted
 
         """
-        record = self._build_record("06", "", account_number, 0.0, "")
-        self.transactions.append(record)
+        record = _DELETE_PREFIX + _format_account(account_number) + _ZERO_TAIL
+        self._append(record)
 
     def log_disable(self, account_number):
         """
@@ -147,8 +266,8 @@ class TransactionLog:
             account_number (str): Account being disabled
 
         """
-        record = self._build_record("07", "", account_number, 0.0, "")
-        self.transactions.append(record)
+        record = _DISABLE_PREFIX + _format_account(account_number) + _ZERO_TAIL
+        self._append(record)
 
     def log_change_plan(self, account_number):
         """
@@ -158,8 +277,25 @@ class TransactionLog:
             account_number (str): Account changing from SP to NP
 
         """
-        record = self._build_record("08", "", account_number, 0.0, "NP")
-        self.transactions.append(record)
+        record = _CHANGE_PLAN_PREFIX + _format_account(account_number) + _ZERO_CHANGE_PLAN_TAIL
+        self._append(record)
+
+    def log_many(self, entries):
+        """
+        Record a batch of transactions in one call.
+
+        Intended for bulk admin work (e.g. scripted account creation)
+        where calling a log_* method per record would dominate.
+
+        Args:
+            entries: Iterable of (code, name, account_number, amount, misc)
+                tuples, in the same order as _build_record's arguments
+
+        """
+        append = self._append
+        build = self._build_record
+        for code, name, account_number, amount, misc in entries:
+            append(build(code, name, account_number, amount, misc))
 
     def write_to_file(self, filename):
         """
@@ -170,18 +306,26 @@ class TransactionLog:
 
         """
         try:
-            with open(filename, "w") as file:
-
-                for transaction in self.transactions:
-                    file.write(transaction + "\n")
-
-                end_marker = "00".ljust(self.RECORD_LEN)[:self.RECORD_LEN]
-                file.write(end_marker + "\n")
-
-            print(f"Successfully wrote {len(self.transactions)} transactions to {filename}")
-
-        except Exception as e:
+            # The buffer already holds every newline-terminated record, so
+            # the whole session is emitted with a single write system call,
+            # bypassing the buffered file object entirely.
+            payload = self.transactions + self._END_MARKER
+
+            fd = os.open(filename, _WRITE_FLAGS, 0o644)
+            try:
+                # os.write may accept fewer bytes than offered (signals,
+                # pipes, very large payloads); keep submitting the rest.
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+
+        except OSError as e:
             print(f"ERROR: Could not write to file {filename}: {e}")
+            return
+
+        print(f"Successfully wrote {self._count} transactions to {filename}")
 
     def get_transaction_count(self):
         """
@@ -191,47 +335,4 @@ class TransactionLog:
             int: Number of transactions
 
         """
-        return len(self.transactions)
-
-    def _format_account(self, account_number):
-        """
-        Format account number as 5-digit zero-filled string.
-
-        Args:
-            account_number (str/int): Raw account number
-
-        Returns:
-            str: 5-digit zero-filled account number
-
-        """
-        if isinstance(account_number, str):
-            digits = "".join(filter(str.isdigit, account_number))
-            num = int(digits) if digits else 0
-        else:
-            num = int(account_number)
-
-        return f"{num:05d}"
-
-    def _format_amount(self, amount):
-        """
-        Format amount as 8-character string with two decimal places.
-
-        Example:
-            110 → "00110.00"
-
-        Args:
-            amount (float/int): Dollar amount
-
-        Returns:
-            str: 8-character formatted amount
-            
-        """
-        amt_float = float(amount)
-        dollars = int(amt_float)
-        cents = int(round((amt_float - dollars) * 100))
-
-        if cents >= 100:
-            dollars += 1
-            cents -= 100
-
-        return f"{dollars:05d}.{cents:02d}"
\ No newline at end of file
+        return self._count
@@ -15,6 +15,87 @@ account operations to AccountManager.
 
 """
 
+import sys
+from functools import wraps
+from types import MappingProxyType
+
+# Error messages shared by several transaction types.
+_ERR_NOT_LOGGED_IN = "ERROR: Must be logged in first"
+_ERR_EMPTY_NAME = "ERROR: Name cannot be empty"
+_ERR_NAME_TOO_LONG = "ERROR: Name cannot exceed 20 characters"
+_ERR_AMOUNT_NOT_POSITIVE = "ERROR: Amount must be positive"
+_ERR_INVALID_AMOUNT = "ERROR: Invalid amount"
+
+
+def read_line(prompt=""):
+    """
+    Drop-in replacement for input() when stdin is a pipe or file.
+
+    Writes the prompt and reads the next line straight from the buffered
+    sys.stdin, skipping the stdout flush and readline hook input() goes
+    through on every call. Scripted sessions issue several prompts per
+    transaction, so this keeps them from paying a syscall round-trip each.
+
+    Args:
+        prompt: Text written before reading
+
+    Returns:
+        The line without its trailing newline.
+
+    Raises:
+        EOFError: When stdin is exhausted, like input().
+
+    """
+    sys.stdout.write(prompt)
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith("\n") else line
+
+
+def _requires_login(method):
+    """
+    Decorator: run a process_* method only inside an active session.
+
+    Reports the standard error and returns early otherwise.
+
+    """
+    @wraps(method)
+    def wrapper(self):
+        if not self._load_session_state():
+            self._emit(_ERR_NOT_LOGGED_IN)
+            return
+        return method(self)
+
+    return wrapper
+
+
+def _requires_admin(action):
+    """
+    Decorator: run a process_* method only inside an admin session.
+
+    Args:
+        action: Transaction name used in the rejection message,
+            e.g. "Create account"
+
+    """
+    not_admin = f"ERROR: {action} is admin only"
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self):
+            if not self._load_session_state():
+                self._emit(_ERR_NOT_LOGGED_IN)
+                return
+            if not self._admin_session:
+                self._emit(not_admin)
+                return
+            return method(self)
+
+        return wrapper
+
+    return decorator
+
 
 class TransactionProcessor:
     """
@@ -34,6 +115,13 @@ class TransactionProcessor:
 
     """
 
+    # Bill payees accepted by paybill, keyed by company code.
+    VALID_COMPANIES = MappingProxyType({
+        "EC": "The Bright Light Electric Company",
+        "CQ": "Credit Card Company Q",
+        "FI": "Fast Internet, Inc."
+    })
+
     def __init__(self, session_manager, account_manager, transaction_log, transaction_file="daily_transaction.txt"):
         """
         Initialize TransactionProcessor.
@@ -49,9 +137,132 @@ class TransactionProcessor:
         self.account_manager = account_manager
         self.transaction_log = transaction_log
         self.transaction_file = transaction_file
-        self.scanner = input
+        # Interactive terminals keep input() for line editing; piped or
+        # redirected input is read through the buffered stream directly.
+        self.scanner = input if sys.stdin.isatty() else read_line
         self.session_deposits = {}  # tracks deposits made this session
+        self._pending_output = []   # messages for the current command
+
+        # Session state snapshot for the transaction being processed,
+        # refreshed by _load_session_state.
+        self._admin_session = False
+        self._session_user_key = None
+
+        # Session limits are fixed for the lifetime of the SessionManager,
+        # so the limit error messages are rendered once here.
+        self._err_withdrawal_limit = f"ERROR: Would exceed ${session_manager.withdrawal_limit} session limit"
+        self._err_transfer_limit = f"ERROR: Would exceed ${session_manager.transfer_limit} session limit"
+        self._err_paybill_limit = f"ERROR: Would exceed ${session_manager.paybill_limit} session limit"
+
+    def _load_session_state(self):
+        """
+        Snapshot the session state needed by one transaction.
+
+        Reads SessionManager's attributes once, so the transaction does not
+        go back through is_logged_in(), is_admin() and get_current_user()
+        for every check. The admin flag is the bool SessionManager caches
+        at login, so no mode string is compared per transaction.
+
+        Returns:
+            True if a session is active.
+
+        """
+        session = self.session
+        self._admin_session = session._is_admin
+        self._session_user_key = session.current_user_key
+        return session.logged_in
+
+    def _emit(self, message):
+        """
+        Queue a message for output.
 
+        Messages are collected per command and written with one stdout
+        call by flush_output(), instead of one print() per line.
+
+        Args:
+            message: Line of text to output
+
+        """
+        self._pending_output.append(message)
+
+    def flush_output(self):
+        """
+        Write all queued messages to stdout in a single call.
+
+        FrontEndApp calls this after every command; process_logout calls
+        it itself before the session ends.
+
+        """
+        if self._pending_output:
+            sys.stdout.write("\n".join(self._pending_output) + "\n")
+            self._pending_output.clear()
+
+    def _resolve_account(self, acc_num, name=None, require_active=True,
+                         require_owner=False, label="Account"):
+        """
+        Look up an account and run the checks shared by most transactions.
+
+        Checks, in order: the account exists, it is active (if required),
+        and either the holder name matches `name` (admin mode) or the
+        account belongs to the current user (if required).
+
+        Args:
+            acc_num: Account number entered by the user
+            name: Holder name to verify, or None to skip the name check
+            require_active: Reject disabled accounts
+            require_owner: Reject accounts not owned by the current user
+                (only applies when no name is given)
+            label: Noun used in error messages ("Account", "Source account")
+
+        Returns:
+            The BankAccount, or None after reporting the error.
+
+        """
+        account = self.account_manager.get_account(acc_num)
+
+        if not account:
+            self._emit(f"ERROR: {label} does not exist")
+            return None
+
+        if require_active and account.status != 'A':
+            self._emit(f"ERROR: {label} is disabled")
+            return None
+
+        if name is not None:
+            if not account.is_held_by(name):
+                self._emit(f"ERROR: {label} holder name does not match")
+                return None
+        elif require_owner:
+            if not account.is_valid_for_key(self._session_user_key):
+                self._emit(f"ERROR: {label} does not belong to current user")
+                return None
+
+        return account
+
+    def _read_amount(self, prompt):
+        """
+        Prompt for a transaction amount and validate it.
+
+        Args:
+            prompt: Prompt shown to the user
+
+        Returns:
+            The amount as a positive float, or None after reporting the error.
+
+        """
+        try:
+            amount = float(self.scanner(prompt))
+        except ValueError:
+            self._emit(_ERR_INVALID_AMOUNT)
+            return None
+
+        if amount <= 0:
+            self._emit(_ERR_AMOUNT_NOT_POSITIVE)
+            return None
+
+        return amount
+
+    @_requires_login
     def process_withdrawal(self):
         """
             Process withdrawal transaction (code 01).
@@ -64,63 +275,49 @@ class TransactionProcessor:
             - Session withdrawal limit
             - Sufficient funds
         """
-        if not self.session.is_logged_in():
-            print("ERROR: Must be logged in first")
-            return
-
-        if self.session.is_admin():
+        name = None
+        if self._admin_session:
             name = self.scanner("Enter account holder's name: ").strip()
             if not name:
-                print("ERROR: Name cannot be empty")
+                self._emit(_ERR_EMPTY_NAME)
                 return
 
         acc_num = self.scanner("Enter account number: ").strip()
-        account = self.account_manager.get_account(acc_num)
-
+        account = self._resolve_account(acc_num, name, require_owner=True)
         if not account:
-            print("ERROR: Account does not exist")
             return
 
-        if account.status != 'A':
-            print("ERROR: Account is disabled")
+        amount = self._read_amount("Enter amount to withdraw: $")
+        if amount is None:
             return
 
-        if self.session.is_admin():
-            if account.holder_name.strip() != name.strip():
-                print("ERROR: Account holder name does not match")
-                return
+        deposited = self.session_deposits.get(acc_num, 0)
+        if amount > account.balance - deposited:
+            funds_error = "ERROR: Withdrawal limit reached - deposited funds cannot be used this session"
+        elif not account.balance >= amount:
+            funds_error = "ERROR: Insufficient funds"
         else:
-            if not account.is_valid_for(self.session.get_current_user()):
-                print("ERROR: Account does not belong to current user")
-                return
+            funds_error = None
 
-        try:
-            amount = float(self.scanner("Enter amount to withdraw: $"))
-            if amount <= 0:
-                print("ERROR: Amount must be positive")
-                return
-        except ValueError:
-            print("ERROR: Invalid amount")
+        # The session limit is reported ahead of any funds problem, but is
+        # only charged (by try_withdraw) once the withdrawal will succeed.
+        if funds_error is not None:
+            if self.session.can_withdraw(amount):
+                self._emit(funds_error)
+            else:
+                self._emit(self._err_withdrawal_limit)
             return
 
-        if not self.session.can_withdraw(amount):
-            print(f"ERROR: Would exceed ${self.session.withdrawal_limit} session limit")
+        if not self.session.try_withdraw(amount):
+            self._emit(self._err_withdrawal_limit)
             return
 
-        deposited = self.session_deposits.get(acc_num, 0)
-        available = account.balance - deposited
-        if amount > available:
-            print("ERROR: Withdrawal limit reached - deposited funds cannot be used this session")
-            return
-
-        if account.withdraw(amount):
-            self.session.record_withdrawal(amount)
-            self.transaction_log.log_withdrawal(acc_num, amount)
-            print(f"Withdrawal successful. New balance: ${account.balance:.2f}")
-        else:
-            print("ERROR: Insufficient funds")
+        account.withdraw(amount)
+        self.transaction_log.log_withdrawal(acc_num, amount)
+        self._emit(f"Withdrawal successful. New balance: ${account.balance:.2f}")
 
 
+    @_requires_login
     def process_transfer(self):
         """
         Process transfer transaction (code 02).
@@ -141,73 +338,53 @@ class TransactionProcessor:
 
         """
 
-        if not self.session.is_logged_in():
-            print("ERROR: Must be logged in first")
-            return
-        
-        if self.session.is_admin():
+        name = None
+        if self._admin_session:
             name = self.scanner("Enter source account holder's name: ").strip()
             if not name:
-                print("ERROR: Name cannot be empty")
+                self._emit(_ERR_EMPTY_NAME)
                 return
 
         from_acc = self.scanner("Enter account number to transfer FROM: ").strip()
-        account_from = self.account_manager.get_account(from_acc)
-
+        account_from = self._resolve_account(
+            from_acc, name, require_owner=True, label="Source account"
+        )
         if not account_from:
-            print("ERROR: Source account does not exist")
-            return
-
-        if account_from.status != 'A':
-            print("ERROR: Source account is disabled")
             return
 
-        if self.session.is_admin():
-            if account_from.holder_name.strip() != name.strip():
-                print("ERROR: Source account holder name does not match")
-                return
-        else:
-            if not account_from.is_valid_for(self.session.get_current_user()):
-                print("ERROR: Source account does not belong to current user")
-                return
-
         to_acc = self.scanner("Enter account number to transfer TO: ").strip()
-        account_to = self.account_manager.get_account(to_acc)
-
+        account_to = self._resolve_account(to_acc, label="Destination account")
         if not account_to:
-            print("ERROR: Destination account does not exist")
             return
 
-        if account_to.status != 'A':
-            print("ERROR: Destination account is disabled")
+        amount = self._read_amount("Enter amount to transfer: $")
+        if amount is None:
             return
 
-        try:
-            amount = float(self.scanner("Enter amount to transfer: $"))
-            if amount <= 0:
-                print("ERROR: Amount must be positive")
-                return
-        except ValueError:
-            print("ERROR: Invalid amount")
+        # As in process_withdrawal: the limit error takes precedence, and
+        # the limit is only charged once the transfer will succeed.
+        if not account_from.balance >= amount:
+            if self.session.can_transfer(amount):
+                self._emit("ERROR: Insufficient funds in source account")
+            else:
+                self._emit(self._err_transfer_limit)
             return
 
-        if not self.session.can_transfer(amount):
-            print(f"ERROR: Would exceed ${self.session.transfer_limit} session limit")
+        if not self.session.try_transfer(amount):
+            self._emit(self._err_transfer_limit)
             return
 
-        if account_from.withdraw(amount):
-            account_to.deposit(amount)
-            self.session.record_transfer(amount)
+        account_from.withdraw(amount)
+        account_to.deposit(amount)
 
-            self.transaction_log.log_transfer(from_acc, amount)
-            self.transaction_log.log_transfer(to_acc, amount)
+        self.transaction_log.log_transfer(from_acc, amount)
+        self.transaction_log.log_transfer(to_acc, amount)
 
-            print("Transfer successful.")
-            print(f"Source balance: ${account_from.balance:.2f}")
-            print(f"Destination balance: ${account_to.balance:.2f}")
-        else:
-            print("ERROR: Insufficient funds in source account")
+        self._emit("Transfer successful.")
+        self._emit(f"Source balance: ${account_from.balance:.2f}")
+        self._emit(f"Destination balance: ${account_to.balance:.2f}")
 
+    @_requires_login
     def process_paybill(self):
         """
         Process paybill transaction (code 03).
@@ -223,69 +400,47 @@ class TransactionProcessor:
 
         """
 
-        if not self.session.is_logged_in():
-            print("ERROR: Must be logged in first")
-            return
-        
-        if self.session.is_admin():
+        name = None
+        if self._admin_session:
             name = self.scanner("Enter account holder's name: ").strip()
             if not name:
-                print("ERROR: Name cannot be empty")
+                self._emit(_ERR_EMPTY_NAME)
                 return
 
-        valid_companies = {
-            "EC": "The Bright Light Electric Company",
-            "CQ": "Credit Card Company Q",
-            "FI": "Fast Internet, Inc."
-        }
-
         acc_num = self.scanner("Enter account number: ").strip()
-        account = self.account_manager.get_account(acc_num)
-
+        account = self._resolve_account(acc_num, name, require_owner=True)
         if not account:
-            print("ERROR: Account does not exist")
             return
 
-        if account.status != 'A':
-            print("ERROR: Account is disabled")
-            return
-
-        if self.session.is_admin():
-            if account.holder_name.strip() != name.strip():
-                print("ERROR: Account holder name does not match")
-                return
-        else:
-            if not account.is_valid_for(self.session.get_current_user()):
-                print("ERROR: Account does not belong to current user")
-                return
-
         company = self.scanner("Enter company code (EC, CQ, or FI): ").strip().upper()
 
-        if company not in valid_companies:
-            print("ERROR: Invalid company. Must be EC, CQ, or FI")
+        if company not in self.VALID_COMPANIES:
+            self._emit("ERROR: Invalid company. Must be EC, CQ, or FI")
             return
 
-        try:
-            amount = float(self.scanner("Enter amount to pay: $"))
-            if amount <= 0:
-                print("ERROR: Amount must be positive")
-                return
-        except ValueError:
-            print("ERROR: Invalid amount")
+        amount = self._read_amount("Enter amount to pay: $")
+        if amount is None:
             return
 
-        if not self.session.can_pay_bill(amount):
-            print(f"ERROR: Would exceed ${self.session.paybill_limit} session limit")
+        # As in process_withdrawal: the limit error takes precedence, and
+        # the limit is only charged once the payment will succeed.
+        if not account.balance >= amount:
+            if self.session.can_pay_bill(amount):
+                self._emit("ERROR: Insufficient funds")
+            else:
+                self._emit(self._err_paybill_limit)
             return
 
-        if account.withdraw(amount):
-            self.session.record_pay_bill(amount)
-            self.transaction_log.log_paybill(acc_num, amount, company)
-            print(f"Payment to {valid_companies[company]} successful.")
-            print(f"New balance: ${account.balance:.2f}")
-        else:
-            print("ERROR: Insufficient funds")
+        if not self.session.try_pay_bill(amount):
+            self._emit(self._err_paybill_limit)
+            return
 
+        account.withdraw(amount)
+        self.transaction_log.log_paybill(acc_num, amount, company)
+        self._emit(f"Payment to {self.VALID_COMPANIES[company]} successful.")
+        self._emit(f"New balance: ${account.balance:.2f}")
+
+    @_requires_login
     def process_deposit(self):
         """
         Process deposit transaction (code 04).
@@ -301,48 +456,30 @@ class TransactionProcessor:
 
         """
 
-        if not self.session.is_logged_in():
-            print("ERROR: Must be logged in first")
-            return
-        
-        if self.session.is_admin():
+        name = None
+        if self._admin_session:
             name = self.scanner("Enter account holder's name: ").strip()
             if not name:
-                print("ERROR: Name cannot be empty")
+                self._emit(_ERR_EMPTY_NAME)
                 return
 
         acc_num = self.scanner("Enter account number: ").strip()
-        account = self.account_manager.get_account(acc_num)
-
+        account = self._resolve_account(acc_num, name)
         if not account:
-            print("ERROR: Account does not exist")
-            return
-
-        if account.status != 'A':
-            print("ERROR: Account is disabled")
             return
 
-        if self.session.is_admin():
-            if account.holder_name.strip() != name.strip():
-                print("ERROR: Account holder name does not match")
-                return
-
-        try:
-            amount = float(self.scanner("Enter amount to deposit: $"))
-            if amount <= 0:
-                print("ERROR: Amount must be positive")
-                return
-        except ValueError:
-            print("ERROR: Invalid amount")
+        amount = self._read_amount("Enter amount to deposit: $")
+        if amount is None:
             return
 
         account.deposit(amount)
         self.session_deposits[acc_num] = self.session_deposits.get(acc_num, 0) + amount
         self.transaction_log.log_deposit(acc_num, amount)
 
-        print(f"Deposit successful. New balance: ${account.balance:.2f}")
-        print("NOTE: Deposited funds are not available for withdrawal in current session.")
+        self._emit(f"Deposit successful. New balance: ${account.balance:.2f}")
+        self._emit("NOTE: Deposited funds are not available for withdrawal in current session.")
 
+    @_requires_admin("Create account")
     def process_create(self):
         """
         Process account creation (code 05).
@@ -350,42 +487,34 @@ class TransactionProcessor:
 
         """
 
-        if not self.session.is_logged_in():
-            print("ERROR: Must be logged in first")
-            return
-
-        if not self.session.is_admin():
-            print("ERROR: Create account is admin only")
-            return
-
         name = self.scanner("Enter account holder name: ").strip()
         if not name:
-            print("ERROR: Name cannot be empty")
+            self._emit(_ERR_EMPTY_NAME)
             return
 
-        MAX_NAME_LENGTH = 20
-        if len(name) > MAX_NAME_LENGTH:
-            print(f"ERROR: Name cannot exceed {MAX_NAME_LENGTH} characters")
+        if len(name) > 20:
+            self._emit(_ERR_NAME_TOO_LONG)
             return
 
         try:
             balance = float(self.scanner("Enter initial balance: $"))
             if balance < 0:
-                print("ERROR: Balance cannot be negative")
+                self._emit("ERROR: Balance cannot be negative")
                 return
         except ValueError:
-            print("ERROR: Invalid amount")
+            self._emit(_ERR_INVALID_AMOUNT)
             return
 
         account_num = self.account_manager.create_account(name, balance)
 
         if account_num:
             self.transaction_log.log_create(account_num, balance, name)
-            print(f"Account created successfully. Account number: {account_num}")
+            self._emit(f"Account created successfully. Account number: {account_num}")
         else:
-            print("ERROR: Could not create account")
+            self._emit("ERROR: Could not create account")
             
 
+    @_requires_admin("Delete account")
     def process_delete(self):
         """
         Process account deletion (code 06).
@@ -393,77 +522,53 @@ class TransactionProcessor:
 
         """
 
-        if not self.session.is_logged_in():
-            print("ERROR: Must be logged in first")
-            return
-
-        if not self.session.is_admin():
-            print("ERROR: Delete account is admin only")
-            return
-
         name = self.scanner("Enter account holder name: ").strip()
         if not name:
-            print("ERROR: Name cannot be empty")
+            self._emit(_ERR_EMPTY_NAME)
             return
         if len(name) > 20:
-            print("ERROR: Name cannot exceed 20 characters")
+            self._emit(_ERR_NAME_TOO_LONG)
             return
 
         acc_num = self.scanner("Enter account number: ").strip()
 
-        account = self.account_manager.get_account(acc_num)
+        account = self._resolve_account(acc_num, name, require_active=False)
         if not account:
-            print("ERROR: Account does not exist")
-            return
-
-        if account.holder_name.strip() != name.strip():
-            print("ERROR: Account holder name does not match")
             return
 
         self.account_manager.delete_account(acc_num)
         self.transaction_log.log_delete(acc_num)
 
-        print(f"Account {acc_num} deleted successfully.")
+        self._emit(f"Account {acc_num} deleted successfully.")
 
+    @_requires_admin("Disable account")
     def process_disable(self):
         """
         Process account disable (code 07).
         Admin-only transaction.
         """
 
-        if not self.session.is_logged_in():
-            print("ERROR: Must be logged in first")
-            return
-
-        if not self.session.is_admin():
-            print("ERROR: Disable account is admin only")
-            return
-
         name = self.scanner("Enter account holder name: ").strip()
         if not name:
-            print("ERROR: Name cannot be empty")
+            self._emit(_ERR_EMPTY_NAME)
             return
         if len(name) > 20:
-            print("ERROR: Name cannot exceed 20 characters")
+            self._emit(_ERR_NAME_TOO_LONG)
             return
 
         acc_num = self.scanner("Enter account number: ").strip()
 
-        account = self.account_manager.get_account(acc_num)
+        account = self._resolve_account(acc_num, name, require_active=False)
         if not account:
-            print("ERROR: Account does not exist")
-            return
-
-        if account.holder_name.strip() != name.strip():
-            print("ERROR: Account holder name does not match")
             return
 
         self.account_manager.disable_account(acc_num)
         self.transaction_log.log_disable(acc_num)
 
-        print(f"Account {acc_num} disabled successfully.")
+        self._emit(f"Account {acc_num} disabled successfully.")
 
 
+    @_requires_admin("Change plan")
     def process_change_plan(self):
         """
         Process change plan (code 08).
@@ -471,41 +576,28 @@ class TransactionProcessor:
 
         """
 
-        if not self.session.is_logged_in():
-            print("ERROR: Must be logged in first")
-            return
-
-        if not self.session.is_admin():
-            print("ERROR: Change plan is admin only")
-            return
-
         name = self.scanner("Enter account holder name: ").strip()
         if not name:
-            print("ERROR: Name cannot be empty")
+            self._emit(_ERR_EMPTY_NAME)
             return
         if len(name) > 20:
-            print("ERROR: Name cannot exceed 20 characters")
+            self._emit(_ERR_NAME_TOO_LONG)
             return
 
         acc_num = self.scanner("Enter account number: ").strip()
 
-        account = self.account_manager.get_account(acc_num)
+        account = self._resolve_account(acc_num, name, require_active=False)
         if not account:
-            print("ERROR: Account does not exist")
-            return
-
-        if account.holder_name.strip() != name.strip():
-            print("ERROR: Account holder name does not match")
             return
 
         if account.plan != 'SP':
-            print("ERROR: Account is not on student plan")
+            self._emit("ERROR: Account is not on student plan")
             return
 
         self.account_manager.change_plan(acc_num)
         self.transaction_log.log_change_plan(acc_num)
 
-        print(f"Account {acc_num} plan changed from SP to NP successfully.")
+        self._emit(f"Account {acc_num} plan changed from SP to NP successfully.")
 
 
     def process_logout(self):
@@ -518,12 +610,13 @@ class TransactionProcessor:
         """
 
         if not self.session.is_logged_in():
-            print("ERROR: Not logged in")
+            self._emit("ERROR: Not logged in")
             return
 
         self.transaction_log.write_to_file(self.transaction_file)
         self.session.logout()
         self.session_deposits = {}
 
-        print(f"Session ended. Transactions written to {self.transaction_file}")
-        print("Goodbye!")
\ No newline at end of file
+        self._emit(f"Session ended. Transactions written to {self.transaction_file}")
+        self._emit("Goodbye!")
+        self.flush_output()
\ No newline at end of file
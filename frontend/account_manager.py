@@ -7,7 +7,19 @@ and applies account changes.
 
 """
 
-from bank_account import BankAccount
+import locale
+import mmap
+import os
+import stat
+import struct
+import sys
+
+from bank_account import BankAccount, normalize_account_number
+
+# One Current Bank Accounts record: number, name, status and balance
+# separated by single spaces, followed by its newline (38 bytes).
+_RECORD = struct.Struct("5sx20sx1sx8sc")
+_RECORD_DATA_LEN = _RECORD.size - 1     # bytes before the newline
 
 
 class AccountManager:
@@ -19,9 +31,12 @@ class AccountManager:
     """
 
     def __init__(self):
-        """Initialize storage for accounts and deleted accounts."""
+        """Initialize storage for accounts."""
         self.accounts = {}            
-        self.deleted_set = set()      
+        self.name_index = {}          # normalized holder name -> account numbers
+        self._next_number = 1         # next candidate for a new account number
+        self._last_key = None         # single-entry get_account cache
+        self._last_account = None
 
     def load_from_file(self, filename):
         """
@@ -31,66 +46,170 @@ class AccountManager:
         NNNNN AAAAAAAAAAAAAAAAAAAA S PPPPPPPP
 
         Stops when holder name is END_OF_FILE.
+
+        A well-formed file is memory-mapped and unpacked record by record
+        with a precompiled struct, straight from the mapping. Anything
+        irregular (short or long lines, CRLF endings, non-ASCII names) is
+        re-parsed line by line from the same mapping, so the file is only
+        ever opened and read once.
+
+        Anything that is not a regular file (a pipe, /dev/stdin, a shell
+        process substitution) cannot be mapped and reports a size of 0, so
+        it is read into memory instead and parsed the same way.
         """
+        self._clear()
+
+        with open(filename, "rb") as file:
+            info = os.fstat(file.fileno())
+            if not stat.S_ISREG(info.st_mode):
+                self._load_data(file.read())
+            elif info.st_size > 0:     # mmap cannot map an empty file
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    self._load_data(data)
+
+        self._next_number = max(map(int, self.accounts), default=0) + 1
+
+    def _load_data(self, data):
+        """Helper: parse accounts file contents, fixed-width if possible."""
+        if not self._load_fixed_width(data):
+            self._clear()
+            self._load_lines(data[:])
+
+    def _clear(self):
+        """Helper: drop all loaded accounts and derived state."""
+        self._last_key = None
         self.accounts.clear()
-        self.deleted_set.clear()
+        self.name_index.clear()
 
-        with open(filename, "r") as file:
-            for line in file:
-                line = line.rstrip("\n")
+    def _load_fixed_width(self, data):
+        """
+        Helper: parse an exactly fixed-width accounts file from a buffer.
+
+        Returns False, possibly after adding some accounts, if the data does
+        not follow the layout and must be parsed line by line.
+        """
+        size = _RECORD.size
+        usable = len(data) - len(data) % size
+        find = data.find
+
+        try:
+            for offset in range(0, usable, size):
+                account_number, holder_name, status, balance_str, newline = \
+                    _RECORD.unpack_from(data, offset)
+
+                if newline != b"\n":
+                    return False
+
+                # Short lines can add up to exactly one record's length
+                # (e.g. "12345\n" then a 31-character line), with line
+                # breaks inside the fields or the unchecked separators.
+                # Text mode would end a line at either byte.
+                end = offset + _RECORD_DATA_LEN
+                if find(b"\n", offset, end) != -1 or find(b"\r", offset, end) != -1:
+                    return False
+
+                # Strict ASCII: a multibyte character always puts at least
+                # one non-ASCII byte into a field, so it is caught here.
+                if not self._add_loaded_account(
+                    account_number.decode("ascii"),
+                    holder_name.decode("ascii").strip(),
+                    status.decode("ascii"),
+                    balance_str.decode("ascii").strip(),
+                ):
+                    return True
+        except UnicodeDecodeError:
+            return False
+
+        return usable == len(data)
+
+    def _load_lines(self, data):
+        """
+        Helper: parse the raw accounts file contents line by line.
 
+        Decodes and splits the data the way iterating over the file in text
+        mode would: default encoding, and universal newlines (\\n, \\r\\n
+        and \\r each end a line). str.splitlines is not used because it
+        also breaks on form feeds and other separators a name may contain.
+        """
+        text = data.decode(locale.getpreferredencoding(False))
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+        for line in text.split("\n"):
         
-                if len(line) < 37: #for handling bad input to avoid crash
-                    continue
+            if len(line) < 37: #for handling bad input to avoid crash
+                continue
+
+            if not self._add_loaded_account(
+                line[0:5],
+                line[6:26].strip(),
+                line[27:28],
+                line[29:37].strip(),
+            ):
+                break
+
+    def _add_loaded_account(self, account_number, holder_name, status, balance_str):
+        """
+        Helper: validate the fields of one accounts file record and store it.
 
-                account_number = line[0:5]
-                holder_name = line[6:26].strip()
-                status = line[27:28]
-                balance_str = line[29:37].strip()
+        Returns False when the END_OF_FILE record is reached, else True
+        (including when an invalid record is skipped).
+        """
+        if holder_name == "END_OF_FILE":
+            return False
 
-                if holder_name == "END_OF_FILE":
-                    break
+        if not account_number.isdigit():
+            return True
 
-                if not account_number.isdigit():
-                    continue
+        if status not in ["A", "D"]:
+            status = "A"
 
-                if status not in ["A", "D"]:
-                    status = "A"
+        try:
+            balance = float(balance_str)
+        except ValueError:
+            return True
 
-                try:
-                    balance = float(balance_str)
-                except ValueError:
-                    continue
+        # Account numbers are interned wherever they become dict keys, so
+        # the same key object is shared by accounts, name_index and
+        # BankAccount.account_number.
+        account_number = sys.intern(account_number)
 
-                
-                self.accounts[account_number] = BankAccount(
-                    account_number=account_number,
-                    holder_name=holder_name,
-                    balance=balance,
-                    status=status,
-                    plan="NP"
-                )
+        # Every field is validated above (and the name is at most 20
+        # characters, stripped), so skip BankAccount.__init__ re-checking it.
+        self.accounts[account_number] = BankAccount._from_record(
+            account_number, holder_name, balance, status, "NP"
+        )
+        self._index_name(holder_name, account_number)
+        return True
 
     def user_exists(self, user_name):
         """
         Check if a user exists in any account.
-        
+
+        Uses the holder name index, so this is a single dict lookup
+        instead of a scan over every account.
         """
-        for acc_num, account in self.accounts.items():
-            if account.holder_name.strip().lower() == user_name.strip().lower():
-                return True
-        return False
+        return user_name.strip().lower() in self.name_index
 
     def get_account(self, account_number):
         """
         Returns BankAccount object for given account number, or None if not found.
+
+        A transaction often looks up the same account number more than once,
+        so the last string lookup is remembered and repeated calls skip the
+        normalization and dict probes.
         """
-        normalized_number = str(account_number).strip().zfill(5)
+        if account_number == self._last_key and type(account_number) is str:
+            return self._last_account
+
+        normalized_number = normalize_account_number(account_number)
 
-        if normalized_number in self.deleted_set:
-            return None
+        account = self.accounts.get(normalized_number)
 
-        return self.accounts.get(normalized_number)
+        if type(account_number) is str:
+            self._last_key = account_number
+            self._last_account = account
+
+        return account
 
     def create_account(self, holder_name, balance):
         """
@@ -110,6 +229,7 @@ class AccountManager:
         balance = max(0.0, min(balance, 99999.99))
 
         new_number = self._generate_unique_account_number()
+        self._last_key = None   # may have cached a miss for this number
 
         self.accounts[new_number] = BankAccount(
             account_number=new_number,
@@ -118,21 +238,24 @@ class AccountManager:
             status="A",
             plan="SP"
         )
+        self._index_name(holder_name, new_number)
 
         return new_number
 
     def delete_account(self, account_number):
         """
-        Marks account as deleted by adding to deleted set.
+        Removes account from the accounts dictionary.
         Returns True if account existed, else False.
         """
-        normalized_number = str(account_number).strip().zfill(5)
+        normalized_number = normalize_account_number(account_number)
 
-        if normalized_number in self.accounts:
-            self.deleted_set.add(normalized_number)
-            return True
+        account = self.accounts.pop(normalized_number, None)
+        if account is None:
+            return False
 
-        return False
+        self._last_key = None
+        self._unindex_name(account.holder_name, account.account_number)
+        return True
 
     def disable_account(self, account_number):
         """
@@ -161,27 +284,52 @@ class AccountManager:
 
         return False
 
-    def _generate_unique_account_number(self):
+    def rename_holder(self, account_number, holder_name):
         """
-        Helper: generate a unique 5-digit account number based on the highest
-        existing account number plus one.
+        Retrieves account and changes its holder name, keeping the name
+        index (and so user_exists) in step with the new name.
+        Returns True if successful, else False.
         """
-        existing_numbers = [
-            int(acc_num)
-            for acc_num in self.accounts
-            if acc_num.isdigit() and int(acc_num) > 0
-        ]
+        account = self.get_account(account_number)
+        if account is None:
+            return False
+
+        self._unindex_name(account.holder_name, account.account_number)
+        account.set_holder_name(holder_name)
+        self._index_name(account.holder_name, account.account_number)
+        return True
 
-        next_number = max(existing_numbers, default=0) + 1
+    def _index_name(self, holder_name, account_number):
+        """Helper: add an account number under its normalized holder name."""
+        key = holder_name.strip().lower()
+        self.name_index.setdefault(key, set()).add(account_number)
 
-        if next_number >= 100000:
-            raise RuntimeError('No available account numbers remaining.')
+    def _unindex_name(self, holder_name, account_number):
+        """Helper: remove an account number from the holder name index."""
+        key = holder_name.strip().lower()
+        numbers = self.name_index.get(key)
+        if numbers is None:
+            return
 
-        candidate = str(next_number).zfill(5)
+        numbers.discard(account_number)
+        if not numbers:
+            del self.name_index[key]
 
-        if candidate in self.accounts or candidate in self.deleted_set:
-            raise RuntimeError('Unable to generate a unique account number.')
+    def _generate_unique_account_number(self):
+        """
+        Helper: generate a unique 5-digit account number based on the highest
+        existing account number plus one.
+
+        The next candidate is tracked in a cursor set by load_from_file, so
+        each call is O(1) instead of rescanning every account. Numbers of
+        deleted accounts are never handed out again, since the day's
+        transaction file may still refer to them.
+        """
+        while self._next_number < 100000:
+            candidate = str(self._next_number).zfill(5)
+            self._next_number += 1
 
-        return candidate
+            if candidate not in self.accounts:
+                return sys.intern(candidate)
 
         raise RuntimeError("No available account numbers remaining.")
\ No newline at end of file
@@ -7,6 +7,28 @@ name, status, balance, plan.
 
 """
 
+import sys
+
+
+def normalize_account_number(account_number):
+    """
+    Return an account number as a 5-digit zero-filled string.
+
+    Input that is already a 5-digit string (the usual case, since the
+    front end reads account numbers as text) is returned unchanged
+    without allocating new strings. Other input is normalized and
+    interned, like the account number keys in AccountManager.
+
+    Args:
+        account_number: Account number as str or int
+
+    Returns:
+        5-digit account number string
+    """
+    if type(account_number) is str and len(account_number) == 5 and account_number.isdigit():
+        return account_number
+    return sys.intern(str(account_number).strip().zfill(5))
+
 
 class BankAccount:
     """
@@ -21,6 +43,11 @@ class BankAccount:
         status: Account status - 'A' (active) or 'D' (disabled)
         plan: Transaction plan - 'SP' (student) or 'NP' (non-student)
     """
+
+    # Fixed attribute set: no per-instance __dict__, and attribute reads on
+    # the transaction path are direct slot loads.
+    __slots__ = ('account_number', 'holder_name', 'balance', 'status', 'plan',
+                 '_name_key')
     
     def __init__(self, account_number, holder_name, balance, status='A', plan='SP'):
         """
@@ -33,24 +60,52 @@ class BankAccount:
             status: 'A' for active or 'D' for disabled (default: 'A')
             plan: 'SP' for student plan or 'NP' for non-student (default: 'SP')
         """
-        self.account_number = str(account_number).zfill(5)
+        self.account_number = normalize_account_number(account_number)
         self.holder_name = str(holder_name).strip()[:20]  # Max 20 chars
+        self._name_key = sys.intern(self.holder_name.lower())   # for name matching
         self.balance = float(balance)
         self.status = status if status in ['A', 'D'] else 'A'
         self.plan = plan if plan in ['SP', 'NP'] else 'SP'
     
+    @classmethod
+    def _from_record(cls, account_number, holder_name, balance, status, plan):
+        """
+        Build an account from fields that have already been validated.
+
+        Used by AccountManager when loading the accounts file, where every
+        field has just been parsed and checked, so the normalization done
+        by __init__ would only repeat that work once per account.
+
+        Args:
+            account_number: 5-digit account number string
+            holder_name: Stripped holder name (max 20 chars)
+            balance: Balance as float
+            status: 'A' or 'D'
+            plan: 'SP' or 'NP'
+
+        Returns:
+            New BankAccount
+        """
+        account = cls.__new__(cls)
+        account.account_number = account_number
+        account.holder_name = holder_name
+        account._name_key = sys.intern(holder_name.lower())
+        account.balance = balance
+        account.status = status
+        account.plan = plan
+        return account
+    
     def withdraw(self, amount):
         """
         Deducts amount from balance if sufficient funds exist.
         
         Args:
-            amount: Amount to withdraw
+            amount: Amount to withdraw, already converted to float by
+                the caller
             
         Returns:
             True if withdrawal successful, False if insufficient funds
         """
-        amount = float(amount)
-        
         if amount <= 0:
             return False
         
@@ -65,13 +120,12 @@ class BankAccount:
         Adds amount to balance.
         
         Args:
-            amount: Amount to deposit
+            amount: Amount to deposit, already converted to float by
+                the caller
             
         Returns:
             True (deposits always succeed for valid amounts)
         """
-        amount = float(amount)
-        
         if amount <= 0:
             return False
         
@@ -81,6 +135,9 @@ class BankAccount:
     def is_valid_for(self, user):
         """
         Returns True if account belongs to specified user AND account status is active (A).
+
+        Names are matched ignoring case and surrounding whitespace, the same
+        way AccountManager.user_exists matches them at login.
         
         Args:
             user: Username to check ownership against
@@ -94,8 +151,41 @@ class BankAccount:
         if user is None:
             return False
         
-        return self.holder_name.strip() == str(user).strip()
+        return self.is_valid_for_key(str(user).strip().lower())
+    
+    def is_valid_for_key(self, user_key):
+        """
+        Like is_valid_for, but takes the user name already normalized
+        (stripped and lower-cased), so repeated checks within a session
+        skip normalizing it again.
+
+        Name keys are interned on both sides, so for the session's own
+        accounts the match is an identity check before any comparison.
+        
+        Args:
+            user_key: Normalized username, e.g. SessionManager.current_user_key
+            
+        Returns:
+            True if account is valid for the user, False otherwise
+        """
+        key = self._name_key
+        return self.status == 'A' and (key is user_key or key == user_key)
     
+    def is_held_by(self, name):
+        """
+        Returns True if the account holder's name matches the given name.
+
+        Matching ignores case and surrounding whitespace, like is_valid_for,
+        but does not look at the account status.
+
+        Args:
+            name: Holder name to compare against
+
+        Returns:
+            True if the names match, False otherwise
+        """
+        return self._name_key == str(name).strip().lower()
+
     # Getters
     def get_account_number(self):
         """Return the account number."""
@@ -125,16 +215,21 @@ class BankAccount:
         Args:
             account_number: New account number
         """
-        self.account_number = str(account_number).zfill(5)
+        self.account_number = normalize_account_number(account_number)
     
     def set_holder_name(self, holder_name):
         """
         Set the account holder's name.
+
+        For an account held by an AccountManager, use
+        AccountManager.rename_holder instead, which also updates the
+        manager's holder name index.
         
         Args:
             holder_name: New holder name (max 20 chars)
         """
         self.holder_name = str(holder_name).strip()[:20]
+        self._name_key = sys.intern(self.holder_name.lower())
     
     def set_balance(self, balance):
         """
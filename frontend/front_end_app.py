@@ -10,11 +10,6 @@ The FrontEndApp is responsible for:
 
 """
 
-from session_manager import SessionManager
-from account_manager import AccountManager
-from TransactionProcessor import TransactionProcessor
-from TransactionLog import TransactionLog
-
 
 class FrontEndApp:
     """
@@ -33,6 +28,13 @@ class FrontEndApp:
         :param transaction_file: Path to output transaction file
 
         """
+        # Imported here rather than at module level so that importing this
+        # module (e.g. from tests) does not pull in the whole transaction
+        # stack until an app is actually built.
+        from session_manager import SessionManager
+        from TransactionProcessor import TransactionProcessor
+        from TransactionLog import TransactionLog
+
         self.account_manager = account_manager
         self.transaction_file = transaction_file
         self.session_manager = SessionManager()
@@ -44,16 +46,37 @@ class FrontEndApp:
             self.transaction_file
         )
 
+        # Command name -> handler, built once; also the source of the
+        # valid-commands list shown for unknown input.
+        processor = self.transaction_processor
+        self._dispatch = {
+            "login": self.handle_login,
+            "logout": processor.process_logout,
+            "withdrawal": processor.process_withdrawal,
+            "transfer": processor.process_transfer,
+            "paybill": processor.process_paybill,
+            "deposit": processor.process_deposit,
+            "create": processor.process_create,
+            "delete": processor.process_delete,
+            "disable": processor.process_disable,
+            "changeplan": processor.process_change_plan,
+        }
+        self._valid_commands = "Valid commands: " + ", ".join(self._dispatch)
+
     def main(self):
         """
         Main execution loop for the front end.
 
         Continuously reads commands from standard input until EOF or quit.
+        Commands are read with the processor's line reader, so piped or
+        redirected input skips input()'s per-call overhead here too.
 
         """
+        read = self.transaction_processor.scanner
+
         while True:
             try:
-                command = input("Enter command: ").strip().lower()
+                command = read("Enter command: ").strip().lower()
                 
                 if not command:
                     continue
@@ -88,39 +111,18 @@ class FrontEndApp:
         :param command: Transaction code entered by user
 
         """
-        if command == "login":
-            self.handle_login()
-
-        elif command == "logout":
-            self.transaction_processor.process_logout()
-
-        elif command == "withdrawal":
-            self.transaction_processor.process_withdrawal()
-
-        elif command == "transfer":
-            self.transaction_processor.process_transfer()
-
-        elif command == "paybill":
-            self.transaction_processor.process_paybill()
-
-        elif command == "deposit":
-            self.transaction_processor.process_deposit()
-
-        elif command == "create":
-            self.transaction_processor.process_create()
-
-        elif command == "delete":
-            self.transaction_processor.process_delete()
-
-        elif command == "disable":
-            self.transaction_processor.process_disable()
-
-        elif command == "changeplan":
-            self.transaction_processor.process_change_plan()
-
-        else:
-            print(f"ERROR: Unknown command '{command}'")
-            print("Valid commands: login, logout, withdrawal, transfer, paybill, deposit, create, delete, disable, changeplan")
+        handler = self._dispatch.get(command)
+
+        try:
+            if handler is not None:
+                handler()
+            else:
+                print(f"ERROR: Unknown command '{command}'")
+                print(self._valid_commands)
+        finally:
+            # Processor messages are queued per command; write them out
+            # in one go now that the command is done.
+            self.transaction_processor.flush_output()
 
     def handle_login(self):
         """
@@ -132,10 +134,11 @@ class FrontEndApp:
             print("ERROR: Already logged in. Please logout first.")
             return
 
-        session_type = input("Session type (standard/admin): ").strip().lower()
+        read = self.transaction_processor.scanner
+        session_type = read("Session type (standard/admin): ").strip().lower()
 
         if session_type == "standard":
-            user_name = input("Enter your name: ").strip()
+            user_name = read("Enter your name: ").strip()
 
             if not self.account_manager.user_exists(user_name):
                 print(f"ERROR: User '{user_name}' does not have any accounts")
@@ -4,18 +4,42 @@ Main Entry Point for Banking System Front End
 Loads accounts and runs FrontEndApp.
 """
 
-from account_manager import AccountManager
-from front_end_app import FrontEndApp
-
 import sys
 sys.stdout.reconfigure(encoding='utf-8') #to fix checkmark error
 
+# Available commands menu, built and encoded once and written to stdout's
+# binary buffer with a single call.
+_MENU = (
+    "\n" + "=" * 80 + "\n"
+    "AVAILABLE COMMANDS:\n"
+    + "=" * 80 + "\n"
+    "login       - Start a session\n"
+    "withdrawal  - Withdraw money\n"
+    "transfer    - Transfer money between accounts\n"
+    "paybill     - Pay a bill\n"
+    "deposit     - Deposit money\n"
+    "create      - Create account (admin only)\n"
+    "delete      - Delete account (admin only)\n"
+    "disable     - Disable account (admin only)\n"
+    "changeplan  - Change plan SP→NP (admin only)\n"
+    "logout      - End session\n"
+    "quit        - Exit program\n"
+    + "=" * 80 + "\n"
+    "\n"
+).encode("utf-8")
+
+
 def main():
     """Main function to run the banking system front end."""
 
     accounts_file = sys.argv[1] if len(sys.argv) > 1 else "current_accounts.txt"
     transaction_file = sys.argv[2] if len(sys.argv) > 2 else "daily_transaction.txt"
 
+    # The front end modules are imported only once they are needed, so a
+    # missing accounts file is reported without loading the transaction
+    # stack.
+    from account_manager import AccountManager
+
     # Print header
     print("=" * 80)
     
@@ -30,25 +54,19 @@ def main():
         print("Make sure the file is in the same folder as this script.")
         return
     
-    # Print available commands menu
-    print("\n" + "=" * 80)
-    print("AVAILABLE COMMANDS:")
-    print("=" * 80)
-    print("login       - Start a session")
-    print("withdrawal  - Withdraw money")
-    print("transfer    - Transfer money between accounts")
-    print("paybill     - Pay a bill")
-    print("deposit     - Deposit money")
-    print("create      - Create account (admin only)")
-    print("delete      - Delete account (admin only)")
-    print("disable     - Disable account (admin only)")
-    print("changeplan  - Change plan SP→NP (admin only)")
-    print("logout      - End session")
-    print("quit        - Exit program")
-    print("=" * 80)
-    print()
+    # Print available commands menu. Text already printed is still in
+    # sys.stdout's text layer, so flush it first to keep the output in
+    # order. A replaced stdout (e.g. io.StringIO) has no binary buffer and
+    # gets the text instead.
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        buffer.write(_MENU)
+    else:
+        sys.stdout.write(_MENU.decode("utf-8"))
     
     # Create and run FrontEndApp
+    from front_end_app import FrontEndApp
     app = FrontEndApp(account_manager, transaction_file)
     app.main()
 
@@ -10,6 +10,37 @@ This module defines the SessionManager class, which is responsible for:
 The SessionManager does not perform transaction logic. It only stores and validates session-related information.
 
 """
+import math
+import sys
+
+
+def _to_cents(amount):
+    """
+    Convert a dollar amount to whole cents.
+
+    Session totals are kept as int cents so that limit checks are exact
+    integer arithmetic. A fraction of a cent is rounded up, never down:
+    the account is still debited the full amount, so rounding down would
+    let sub-cent amounts add up past the limit. (Float noise such as
+    0.07 * 100 == 7.000000000000001 is not treated as a fraction.)
+
+    Non-finite amounts (nan, inf) have no integer value and are passed
+    through, so they compare just as they did as dollars.
+
+    :param amount: Dollar amount
+    :return: Amount in cents
+
+    """
+    cents = amount * 100
+    if not math.isfinite(cents):
+        return cents
+
+    whole = round(cents)
+    if cents - whole > 1e-6:
+        whole += 1
+    return whole
+
+
 class SessionManager:
     """
     SessionManager
@@ -18,9 +49,17 @@ class SessionManager:
 
     """
 
-    STANDARD_WITHDRAWAL_LIMIT = 500.00
-    STANDARD_TRANSFER_LIMIT = 1000.00
-    STANDARD_PAYBILL_LIMIT = 2000.00
+    STANDARD_WITHDRAWAL_LIMIT_CENTS = 50000
+    STANDARD_TRANSFER_LIMIT_CENTS = 100000
+    STANDARD_PAYBILL_LIMIT_CENTS = 200000
+
+    STANDARD_WITHDRAWAL_LIMIT = STANDARD_WITHDRAWAL_LIMIT_CENTS / 100
+    STANDARD_TRANSFER_LIMIT = STANDARD_TRANSFER_LIMIT_CENTS / 100
+    STANDARD_PAYBILL_LIMIT = STANDARD_PAYBILL_LIMIT_CENTS / 100
+
+    # Fixed attribute set: no per-instance __dict__.
+    __slots__ = ('logged_in', 'session_mode', 'current_user_name', 'current_user_key',
+                 'withdrawal_total', 'transfer_total', 'paybill_total', '_is_admin')
 
     def __init__(self):
         """
@@ -30,17 +69,51 @@ class SessionManager:
 
         """
 
-        self.logged_in = False
-        self.session_mode = None #Standard or Admin           
-        self.current_user_name = None
-        self.withdrawal_total = 0.0
-        self.transfer_total = 0.0
-        self.paybill_total = 0.0
-        
-        # For compatibility with TransactionProcessor
-        self.withdrawal_limit = self.STANDARD_WITHDRAWAL_LIMIT
-        self.transfer_limit = self.STANDARD_TRANSFER_LIMIT
-        self.paybill_limit = self.STANDARD_PAYBILL_LIMIT
+        self._reset()
+
+    def _reset(self, logged_in=False, mode=None, user_name=None):
+        """
+        Set the session state and clear the per-session totals.
+
+        Shared by __init__, start_standard_session, start_admin_session
+        and end_session.
+
+        :param logged_in: Whether a session is active
+        :param mode: "standard", "admin" or None
+        :param user_name: Name of the account holder (standard mode only)
+
+        """
+
+        self.logged_in = logged_in
+        self.session_mode = mode #Standard or Admin
+        # Cached so limit checks and is_admin()/is_admin_mode() read a
+        # bool instead of comparing the mode string each time.
+        self._is_admin = mode == "admin"
+        self.current_user_name = user_name
+        # Normalized once here rather than on every ownership check, and
+        # interned so it is usually the very object held by the account.
+        self.current_user_key = None if user_name is None else sys.intern(str(user_name).strip().lower())
+        # Per-session totals, in cents.
+        self.withdrawal_total = 0
+        self.transfer_total = 0
+        self.paybill_total = 0
+
+    # For compatibility with TransactionProcessor. The limits are the same
+    # for every session, so they are read from the class constants.
+    @property
+    def withdrawal_limit(self):
+        """Per-session withdrawal limit for standard sessions."""
+        return self.STANDARD_WITHDRAWAL_LIMIT
+
+    @property
+    def transfer_limit(self):
+        """Per-session transfer limit for standard sessions."""
+        return self.STANDARD_TRANSFER_LIMIT
+
+    @property
+    def paybill_limit(self):
+        """Per-session bill payment limit for standard sessions."""
+        return self.STANDARD_PAYBILL_LIMIT
 
     def login(self, is_admin=False, user_name=None):
         """
@@ -62,12 +135,7 @@ class SessionManager:
 
         """
 
-        self.logged_in = True
-        self.session_mode = "standard"
-        self.current_user_name = user_name
-        self.withdrawal_total = 0.0
-        self.transfer_total = 0.0
-        self.paybill_total = 0.0
+        self._reset(True, "standard", user_name)
 
     def start_admin_session(self):
         """
@@ -75,12 +143,7 @@ class SessionManager:
 
         """
 
-        self.logged_in = True
-        self.session_mode = "admin"
-        self.current_user_name = None
-        self.withdrawal_total = 0.0
-        self.transfer_total = 0.0
-        self.paybill_total = 0.0
+        self._reset(True, "admin")
 
     def logout(self):
         """
@@ -95,12 +158,7 @@ class SessionManager:
     
         """
 
-        self.logged_in = False
-        self.session_mode = None
-        self.current_user_name = None
-        self.withdrawal_total = 0.0
-        self.transfer_total = 0.0
-        self.paybill_total = 0.0
+        self._reset()
 
     def is_logged_in(self):
         """
@@ -120,7 +178,7 @@ class SessionManager:
         :return: True if admin session, False otherwise
 
         """
-        return self.is_admin_mode()
+        return self._is_admin
 
     def is_admin_mode(self):
         """
@@ -130,7 +188,7 @@ class SessionManager:
 
         """
 
-        return self.session_mode == "admin"
+        return self._is_admin
 
     def get_current_user(self):
         """
@@ -149,12 +207,12 @@ class SessionManager:
 
         """
 
-        if self.session_mode == "admin":
+        if self._is_admin:
             return True
 
-        projected_total = self.withdrawal_total + amount
+        projected_total = self.withdrawal_total + _to_cents(amount)
 
-        if projected_total > self.STANDARD_WITHDRAWAL_LIMIT:
+        if projected_total > self.STANDARD_WITHDRAWAL_LIMIT_CENTS:
             return False
 
         return True
@@ -167,7 +225,27 @@ class SessionManager:
         
         """
 
-        self.withdrawal_total += amount
+        self.withdrawal_total += _to_cents(amount)
+
+    def try_withdraw(self, amount):
+        """
+        Check a withdrawal against session rules and, if allowed, record it.
+
+        Equivalent to can_withdraw() followed by record_withdrawal() when
+        it returns True, in a single call.
+
+        :param amount: Withdrawal amount
+        :return: True if allowed (and recorded), False otherwise
+
+        """
+
+        projected_total = self.withdrawal_total + _to_cents(amount)
+
+        if not self._is_admin and projected_total > self.STANDARD_WITHDRAWAL_LIMIT_CENTS:
+            return False
+
+        self.withdrawal_total = projected_total
+        return True
 
     def can_transfer(self, amount):
         """
@@ -178,12 +256,12 @@ class SessionManager:
 
         """
 
-        if self.session_mode == "admin":
+        if self._is_admin:
             return True
 
-        projected_total = self.transfer_total + amount
+        projected_total = self.transfer_total + _to_cents(amount)
 
-        if projected_total > self.STANDARD_TRANSFER_LIMIT:
+        if projected_total > self.STANDARD_TRANSFER_LIMIT_CENTS:
             return False
 
         return True
@@ -196,7 +274,27 @@ class SessionManager:
         
         """
 
-        self.transfer_total += amount
+        self.transfer_total += _to_cents(amount)
+
+    def try_transfer(self, amount):
+        """
+        Check a transfer against session rules and, if allowed, record it.
+
+        Equivalent to can_transfer() followed by record_transfer() when
+        it returns True, in a single call.
+
+        :param amount: Transfer amount
+        :return: True if allowed (and recorded), False otherwise
+
+        """
+
+        projected_total = self.transfer_total + _to_cents(amount)
+
+        if not self._is_admin and projected_total > self.STANDARD_TRANSFER_LIMIT_CENTS:
+            return False
+
+        self.transfer_total = projected_total
+        return True
 
     def can_pay_bill(self, amount):
         """
@@ -207,12 +305,12 @@ class SessionManager:
 
         """
 
-        if self.session_mode == "admin":
+        if self._is_admin:
             return True
 
-        projected_total = self.paybill_total + amount
+        projected_total = self.paybill_total + _to_cents(amount)
 
-        if projected_total > self.STANDARD_PAYBILL_LIMIT:
+        if projected_total > self.STANDARD_PAYBILL_LIMIT_CENTS:
             return False
 
         return True
@@ -225,4 +323,24 @@ class SessionManager:
         
         """
 
-        self.paybill_total += amount
\ No newline at end of file
+        self.paybill_total += _to_cents(amount)
+
+    def try_pay_bill(self, amount):
+        """
+        Check a bill payment against session rules and, if allowed, record it.
+
+        Equivalent to can_pay_bill() followed by record_pay_bill() when
+        it returns True, in a single call.
+
+        :param amount: Payment amount
+        :return: True if allowed (and recorded), False otherwise
+
+        """
+
+        projected_total = self.paybill_total + _to_cents(amount)
+
+        if not self._is_admin and projected_total > self.STANDARD_PAYBILL_LIMIT_CENTS:
+            return False
+
+        self.paybill_total = projected_total
+        return True
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+Front End Unit Testing – AccountManager
+
+Checks that renaming an account holder keeps the holder name index used by
+user_exists up to date.
+"""
+
+import unittest
+
+from account_manager import AccountManager
+
+
+# ===========================================================================
+# rename_holder
+# ===========================================================================
+
+class TestRenameHolder(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = AccountManager()
+        self.first = self.manager.create_account("Jane Smith", 100)
+        self.second = self.manager.create_account("Jane Smith", 50)
+
+    def test_new_name_is_indexed(self):
+        self.assertTrue(self.manager.rename_holder(self.first, "Jane Doe"))
+
+        self.assertEqual(self.manager.get_account(self.first).holder_name, "Jane Doe")
+        self.assertTrue(self.manager.user_exists("jane doe"))
+
+    def test_old_name_kept_while_other_accounts_hold_it(self):
+        self.manager.rename_holder(self.first, "Jane Doe")
+
+        self.assertTrue(self.manager.user_exists("Jane Smith"))
+
+    def test_old_name_dropped_when_no_account_holds_it(self):
+        self.manager.rename_holder(self.first, "Jane Doe")
+        self.manager.rename_holder(self.second, "Jane Doe")
+
+        self.assertFalse(self.manager.user_exists("Jane Smith"))
+
+    def test_unknown_account(self):
+        self.assertFalse(self.manager.rename_holder("99999", "Nobody"))
+        self.assertFalse(self.manager.user_exists("Nobody"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Front End Unit Testing – TransactionLog
+
+Checks that TransactionLog.log_many writes exactly the same records as the
+matching log_* calls, and that every record keeps the 40-character layout.
+"""
+
+import unittest
+
+from TransactionLog import TransactionLog
+
+
+# ===========================================================================
+# Helper
+# ===========================================================================
+
+def log_individually(calls):
+    log = TransactionLog()
+    for method, args in calls:
+        getattr(log, method)(*args)
+    return log
+
+
+# ===========================================================================
+# log_many
+# Entries are (code, name, account_number, amount, misc) tuples.
+# ===========================================================================
+
+class TestLogMany(unittest.TestCase):
+
+    def test_matches_individual_log_calls(self):
+        individual = log_individually([
+            ("log_withdrawal", ("00001", 50)),
+            ("log_transfer", ("00002", 125.5)),
+            ("log_paybill", ("00003", 20.25, "EC")),
+            ("log_deposit", ("4", 1000)),
+            ("log_create", ("00007", 300, "Jane Smith")),
+            ("log_delete", ("00005",)),
+            ("log_disable", ("00006",)),
+            ("log_change_plan", ("00001",)),
+        ])
+
+        batched = TransactionLog()
+        batched.log_many([
+            ("01", "", "00001", 50, ""),
+            ("02", "", "00002", 125.5, ""),
+            ("03", "", "00003", 20.25, "EC"),
+            ("04", "", "4", 1000, ""),
+            ("05", "Jane Smith", "00007", 300, "SP"),
+            ("06", "", "00005", 0, ""),
+            ("07", "", "00006", 0, ""),
+            ("08", "", "00001", 0, "NP"),
+        ])
+
+        self.assertEqual(bytes(batched.transactions), bytes(individual.transactions))
+        self.assertEqual(batched.get_transaction_count(), 8)
+
+    def test_field_order(self):
+        log = TransactionLog()
+        log.log_many([("05", "Jane Smith", "00007", 300, "SP")])
+
+        self.assertEqual(bytes(log.transactions), b"05Jane Smith          0000700300.00SP   \n")
+
+    def test_empty_batch(self):
+        log = TransactionLog()
+        log.log_many([])
+
+        self.assertEqual(bytes(log.transactions), b"")
+        self.assertEqual(log.get_transaction_count(), 0)
+
+    def test_records_are_fixed_width(self):
+        log = TransactionLog()
+        log.log_many([
+            ("05", "José", "00007", 123456, "SP"),
+            ("06", "", "123456", 0, ""),
+        ])
+
+        lines = bytes(log.transactions).decode().split("\n")[:-1]
+        self.assertEqual([len(line) for line in lines], [40, 40])
+
+
+if __name__ == "__main__":
+    unittest.main()